@@ -6,6 +6,8 @@ from tortoise.transactions import in_transaction
 
 @test.requireCapability(daemon=True)
 class TestReconnect(test.IsolatedTestCase):
+    with_clean_db = True
+
     async def test_reconnect(self):
         await Tournament.create(name="1")
 
@@ -1,5 +1,15 @@
 # pylint: disable=W1503
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from tests import testmodels
+from tests.testmodels import Event, Team, Tournament
+from tortoise import Tortoise
 from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError
 
 
 class TestTesterSync(test.SimpleTestCase):
@@ -20,6 +30,12 @@ class TestTesterSync(test.SimpleTestCase):
     def test_moo(self):
         self.assertEqual(self.moo, "SET")
 
+    def test_list_sort_equal(self):
+        self.assertListSortEqual([], [])
+        self.assertListSortEqual([{"a": 2}, {"a": 1}], [{"a": 1}, {"a": 2}], sorted_key="a")
+        with self.assertRaises(AssertionError):
+            self.assertListSortEqual([2, 1], [1, 2, 3])
+
 
 class TestTesterASync(test.SimpleTestCase):
     async def asyncSetUp(self):
@@ -39,3 +55,284 @@ class TestTesterASync(test.SimpleTestCase):
 
     async def test_moo(self):
         self.assertEqual(self.baa, "TES")
+
+
+class TestTesterSharedLoop(test.SimpleTestCase):
+    async def test_shared_loop(self):
+        self.assertIs(asyncio.get_running_loop(), test._LOOP)
+
+    async def test_debug_opt_in(self):
+        debug = asyncio.get_running_loop().get_debug()
+        if os.environ.get("TORTOISE_TEST_DEBUG"):
+            self.assertTrue(debug)
+        else:
+            self.assertEqual(
+                debug, sys.flags.dev_mode or bool(os.environ.get("PYTHONASYNCIODEBUG"))
+            )
+
+    def test_shared_loop_created_once(self):
+        shared_loop = test._LOOP
+        with patch.object(test, "_LOOP", None):
+            loop = test._get_shared_loop()
+            try:
+                self.assertIsNot(loop, shared_loop)
+                self.assertIs(test._get_shared_loop(), loop)
+            finally:
+                asyncio.set_event_loop(shared_loop)
+                loop.close()
+
+
+@test.skipIf(sys.version_info < (3, 11), "Only tests run through an asyncio.Runner")
+class TestTesterPendingTasks(test.SimpleTestCase):
+    task: "asyncio.Task[None]"
+
+    async def test_1_leave_task(self):
+        TestTesterPendingTasks.task = asyncio.ensure_future(asyncio.sleep(3600))
+
+    async def test_2_task_cancelled(self):
+        self.assertTrue(self.task.cancelled())
+
+
+class TestTesterOwnLoop(test.SimpleTestCase):
+    shared_loop = False
+
+    async def test_own_loop(self):
+        self.assertIsNot(asyncio.get_running_loop(), test._LOOP)
+
+
+class TestGetDBConfig(test.SimpleTestCase):
+    def test_cached_config_is_copied(self):
+        with patch.object(test, "_TORTOISE_TEST_DB", "sqlite://:memory:"):
+            config1 = test.getDBConfig(app_label="models", modules=["tests.testmodels"])
+            config2 = test.getDBConfig(app_label="models", modules=["tests.testmodels"])
+        self.assertEqual(config1, config2)
+        self.assertIsNot(config1, config2)
+        self.assertIsNot(config1["apps"], config2["apps"])
+        self.assertIsNot(config1["connections"], config2["connections"])
+
+    def test_module_objects(self):
+        with patch.object(test, "_TORTOISE_TEST_DB", "sqlite://:memory:"):
+            config = test.getDBConfig(app_label="models", modules=[testmodels])
+        self.assertEqual(config["apps"]["models"]["models"], [testmodels])
+
+    def test_randomised_config_is_not_cached(self):
+        with patch.object(test, "_TORTOISE_TEST_DB", "sqlite:///tmp/test-{}.sqlite"):
+            config1 = test.getDBConfig(app_label="models", modules=["tests.testmodels"])
+            config2 = test.getDBConfig(app_label="models", modules=["tests.testmodels"])
+        self.assertNotEqual(
+            config1["connections"]["models"]["credentials"]["file_path"],
+            config2["connections"]["models"]["credentials"]["file_path"],
+        )
+
+
+class TestIsolatedRollback(test.IsolatedTestCase):
+    async def test_create_first(self):
+        self.assertEqual(await Tournament.all().count(), 0)
+        await Tournament.create(name="Test")
+
+    async def test_create_second(self):
+        self.assertEqual(await Tournament.all().count(), 0)
+        await Tournament.create(name="Test")
+
+
+class TestIsolatedCleanDB(TestIsolatedRollback):
+    with_clean_db = True
+
+
+class TestTruncation(test.TruncationTestCase):
+    async def test_truncate_resets_identity(self):
+        tournament = await Tournament.create(name="Test")
+        await self._tearDownDB()
+
+        self.assertEqual(await Tournament.all().count(), 0)
+        self.assertEqual((await Tournament.create(name="Test")).pk, tournament.pk)
+
+    async def test_restore_default_skipped_when_current(self):
+        apps = Tortoise.apps
+        test._restore_default()
+        self.assertIs(Tortoise.apps, apps)
+
+        Tortoise._connections = Tortoise._connections.copy()
+        test._restore_default()
+        self.assertIsNot(Tortoise.apps, apps)
+
+    @test.requireCapability(dialect="postgres")
+    async def test_truncate_clears_m2m(self):
+        tournament = await Tournament.create(name="Test")
+        event = await Event.create(name="Event", tournament=tournament)
+        await event.participants.add(await Team.create(name="Team"))
+        await self._tearDownDB()
+
+        self.assertEqual(
+            await Tortoise.get_connection("models").execute_query_dict(
+                "SELECT COUNT(*) AS count FROM event_team"
+            ),
+            [{"count": 0}],
+        )
+
+
+class TestDefaultStateKept(test.TestCase):
+    apps: dict = {}
+
+    def test_1_first(self):
+        TestDefaultStateKept.apps = Tortoise.apps
+
+    def test_2_not_restored_again(self):
+        self.assertIs(Tortoise.apps, self.apps)
+
+
+class TestDefaultStateDropped(test.SimpleTestCase):
+    async def test_default_state_dropped(self):
+        test._restore_default()
+        await self._setUpDB()
+        self.assertFalse(Tortoise._inited)
+        self.assertEqual(Tortoise._connections, {})
+
+
+class TestTransactionConnection(test.TestCase):
+    async def asyncSetUp(self):
+        # Skip before the test transaction is opened, as tearDown doesn't run after a skip here
+        if test._RESOLVED_CAPS["models"].dialect == "sqlite":
+            self.skipTest("No connection pool")
+        await super().asyncSetUp()
+        self.pool = self.__db__._pool
+        self.pool_connection = self.__transaction__.connection._connection
+
+    async def restart_transaction(self):
+        self.__transaction__ = test.TransactionTestContext(self.__db__._in_transaction().connection)
+        return await self.__transaction__.__aenter__()
+
+    async def test_connection_reused(self):
+        if self.__db__.pool_maxsize < 2:
+            self.skipTest("No connection to spare")
+        await self.__transaction__.__aexit__(None, None, None)
+        self.assertIs(test._TEST_CONNECTIONS[self.pool], self.pool_connection)
+
+        connection = await self.restart_transaction()
+        self.assertIs(connection._connection, self.pool_connection)
+        self.assertNotIn(self.pool, test._TEST_CONNECTIONS)
+
+    async def test_released_after_error(self):
+        await self.__transaction__.__aexit__(RuntimeError, RuntimeError(), None)
+        self.assertNotIn(self.pool, test._TEST_CONNECTIONS)
+        await self.restart_transaction()
+
+    async def test_released_for_single_connection_pool(self):
+        with patch.object(self.__db__, "pool_maxsize", 1):
+            await self.__transaction__.__aexit__(None, None, None)
+        self.assertNotIn(self.pool, test._TEST_CONNECTIONS)
+        await self.restart_transaction()
+
+
+class TestRequireCapability(test.TestCase):
+    @contextmanager
+    def unknown_capabilities(self, **environ):
+        with patch.object(Tortoise, "_inited", False), patch.dict(
+            test._RESOLVED_CAPS, clear=True
+        ), patch.dict(os.environ, environ):
+            if "TORTOISE_TEST_DB" not in environ:
+                os.environ.pop("TORTOISE_TEST_DB", None)
+            yield
+
+    def test_class_decided_when_inited(self):
+        @test.requireCapability(dialect="nonexistent")
+        class Skipped(test.TestCase):
+            def test_nothing(self):
+                pass
+
+        @test.requireCapability(dialect=Tortoise.get_connection("models").capabilities.dialect)
+        class NotSkipped(test.TestCase):
+            def test_nothing(self):
+                pass
+
+        self.assertTrue(getattr(Skipped, "__unittest_skip__", False))
+        self.assertFalse(getattr(NotSkipped, "__unittest_skip__", False))
+        self.assertFalse(hasattr(NotSkipped.test_nothing, "__wrapped__"))
+
+    def test_class_wraps_inherited_tests(self):
+        class Base(test.SimpleTestCase):
+            def test_inherited(self):
+                pass
+
+        with self.unknown_capabilities():
+
+            @test.requireCapability(dialect="nonexistent")
+            class Decorated(Base):
+                def test_own(self):
+                    pass
+
+                async def test_async(self):
+                    pass
+
+        self.assertTrue(hasattr(Decorated.test_own, "__wrapped__"))
+        self.assertTrue(hasattr(Decorated.test_inherited, "__wrapped__"))
+        self.assertFalse(hasattr(Base.test_inherited, "__wrapped__"))
+        self.assertTrue(asyncio.iscoroutinefunction(Decorated.test_async))
+
+    def test_decided_from_db_url(self):
+        with self.unknown_capabilities(TORTOISE_TEST_DB="sqlite:///tmp/test-{}.sqlite"):
+
+            @test.requireCapability(dialect="postgres")
+            def skipped():
+                pass
+
+            @test.requireCapability(dialect="sqlite")
+            def not_skipped():
+                pass
+
+            @test.requireCapability(dialect="sqlite", supports_transactions=True)
+            def checked_on_run():
+                pass
+
+        self.assertTrue(getattr(skipped, "__unittest_skip__", False))
+        self.assertFalse(hasattr(not_skipped, "__wrapped__"))
+        self.assertTrue(hasattr(checked_on_run, "__wrapped__"))
+
+    def test_method_decided_when_resolved(self):
+        @test.requireCapability(dialect="nonexistent")
+        def skipped():
+            pass
+
+        @test.requireCapability(dialect=Tortoise.get_connection("models").capabilities.dialect)
+        def not_skipped():
+            pass
+
+        self.assertTrue(getattr(skipped, "__unittest_skip__", False))
+        self.assertFalse(hasattr(not_skipped, "__wrapped__"))
+
+    def test_unknown_capability(self):
+        @test.requireCapability(dialekt="sqlite")
+        def misspelt():
+            pass
+
+        with self.assertRaises(ConfigurationError):
+            misspelt()
+
+    def test_method_skipped(self):
+        calls = []
+
+        @test.requireCapability(dialect="nonexistent")
+        def skipped():
+            calls.append(1)
+
+        for _ in range(2):
+            with self.assertRaises(test.SkipTest):
+                skipped()
+        self.assertEqual(calls, [])
+
+
+class TestSubstituteWorker(test.SimpleTestCase):
+    def test_worker(self):
+        with patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw1"}):
+            self.assertEqual(
+                test._substitute_worker("postgres://127.0.0.1/test_{worker}_{}"),
+                "postgres://127.0.0.1/test_gw1_{}",
+            )
+
+    def test_not_distributed(self):
+        with patch.dict(os.environ):
+            os.environ.pop("PYTEST_XDIST_WORKER", None)
+            self.assertEqual(
+                test._substitute_worker("sqlite:///tmp/test-\\{worker\\}.sqlite"),
+                "sqlite:///tmp/test-master.sqlite",
+            )
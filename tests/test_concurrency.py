@@ -7,6 +7,8 @@ from tortoise.transactions import in_transaction
 
 
 class TestConcurrencyIsolated(test.IsolatedTestCase):
+    with_clean_db = True
+
     async def test_concurrency_read(self):
         await Tournament.create(name="Test")
         tour1 = await Tournament.first()
@@ -1,16 +1,22 @@
 import asyncio
 import os
 import os as _os
+import sys
 import unittest
 from asyncio.events import AbstractEventLoop
-from functools import wraps
-from types import ModuleType
-from typing import Any, Iterable, List, Optional, Union
+from copy import deepcopy
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
+from types import MappingProxyType, ModuleType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union, cast
 from unittest import SkipTest, expectedFailure, skip, skipIf, skipUnless
 
 from tortoise import Model, Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient, Capabilities
+from tortoise.backends.base.config_generator import expand_db_url as _expand_db_url
 from tortoise.backends.base.config_generator import generate_config as _generate_config
-from tortoise.exceptions import DBConnectionError
+from tortoise.exceptions import ConfigurationError, DBConnectionError
+from tortoise.fields.relational import ManyToManyFieldInstance
 from tortoise.transactions import current_transaction_map
 
 __all__ = (
@@ -39,11 +45,23 @@ On success it will be marked as unexpected success.
 """
 
 _CONFIG: dict = {}
-_CONNECTIONS: dict = {}
+# Read-only snapshots of the default connections and their transaction context vars
+_CONNECTIONS: Mapping[str, BaseDBAsyncClient] = MappingProxyType({})
 _SELECTOR = None
 _LOOP: AbstractEventLoop = None  # type: ignore
 _MODULES: Iterable[Union[str, ModuleType]] = []
-_CONN_MAP: dict = {}
+_CONN_MAP: Mapping[str, Any] = MappingProxyType({})
+_RESTORED_CONNECTIONS: Optional[dict] = None
+# Idle pool connection that the next test transaction runs on, per pool
+_TEST_CONNECTIONS: Dict[Any, Any] = {}
+# Script clearing all tables of the default apps, per connection
+_TRUNCATE_SCRIPTS: Dict[BaseDBAsyncClient, str] = {}
+# Session-wide IsolatedTestCase DBs, keyed by module set: (config, connections, conn_map)
+_SCHEMA_READY: Dict[Tuple[Union[str, ModuleType], ...], Tuple[dict, Mapping, Mapping]] = {}
+# Template DBs for IsolatedTestCase.with_clean_db on PostgreSQL, keyed by module set
+_TEMPLATE_DBS: Dict[Tuple[Union[str, ModuleType], ...], BaseDBAsyncClient] = {}
+# Capabilities of the test DB connections, known once initializer() has run
+_RESOLVED_CAPS: Dict[str, Capabilities] = {}
 
 
 def getDBConfig(app_label: str, modules: Iterable[Union[str, ModuleType]]) -> dict:
@@ -53,12 +71,25 @@ def getDBConfig(app_label: str, modules: Iterable[Union[str, ModuleType]]) -> di
     :param app_label: Label of the app (must be distinct for multiple apps).
     :param modules: List of modules to look for models in.
     """
-    return _generate_config(
-        _TORTOISE_TEST_DB,
-        app_modules={app_label: modules},
-        testing=True,
-        connection_label=app_label,
-    )
+    if "{" in _TORTOISE_TEST_DB:
+        # Randomised DB names have to be generated afresh for every call
+        return _generate_config(
+            _TORTOISE_TEST_DB,
+            app_modules={app_label: modules},
+            testing=True,
+            connection_label=app_label,
+        )
+    # Only the parsed connections are cached, as modules may be module objects that can't be copied
+    return {
+        "connections": deepcopy(_getCachedDBConnections(app_label, _TORTOISE_TEST_DB)),
+        "apps": {app_label: {"models": list(modules), "default_connection": app_label}},
+    }
+
+
+@lru_cache(maxsize=None)
+def _getCachedDBConnections(app_label: str, db_url: str) -> dict:
+    config = _generate_config(db_url, app_modules={}, testing=True, connection_label=app_label)
+    return config["connections"]
 
 
 async def _init_db(config: dict) -> None:
@@ -73,11 +104,155 @@ async def _init_db(config: dict) -> None:
 
 
 def _restore_default() -> None:
+    global _RESTORED_CONNECTIONS  # pylint: disable=W0603
+    # Re-initialising the apps is expensive, so skip it if the default state is still in place.
+    # Anything resetting Tortoise (init, closing connections, dropping DBs) replaces the connections dict.
+    if Tortoise._inited and Tortoise._connections is _RESTORED_CONNECTIONS:
+        return
     Tortoise.apps = {}
-    Tortoise._connections = _CONNECTIONS.copy()
+    Tortoise._connections = dict(_CONNECTIONS)
     current_transaction_map.update(_CONN_MAP)
     Tortoise._init_apps(_CONFIG["apps"])
     Tortoise._inited = True
+    _RESTORED_CONNECTIONS = Tortoise._connections
+
+
+def _reset_tortoise() -> None:
+    Tortoise.apps = {}
+    Tortoise._connections = {}
+    Tortoise._inited = False
+
+
+async def _restore_isolated(modules: Tuple[Union[str, ModuleType], ...]) -> None:
+    """
+    Restores the session-wide DB for the given modules, creating it and its schema on first use.
+    """
+    if modules not in _SCHEMA_READY:
+        config = getDBConfig(app_label="models", modules=modules)
+        await Tortoise.init(config, _create_db=True)
+        await Tortoise.generate_schemas(safe=False)
+        _SCHEMA_READY[modules] = (
+            config,
+            MappingProxyType(Tortoise._connections.copy()),
+            MappingProxyType(
+                {name: current_transaction_map[name] for name in Tortoise._connections}
+            ),
+        )
+        return
+
+    config, connections, conn_map = _SCHEMA_READY[modules]
+    Tortoise.apps = {}
+    Tortoise._connections = dict(connections)
+    current_transaction_map.update(conn_map)
+    Tortoise._init_apps(config["apps"])
+    Tortoise._inited = True
+
+
+async def _init_clean_db(modules: Tuple[Union[str, ModuleType], ...]) -> None:
+    """
+    Initialises Tortoise with a new DB for the given modules.
+
+    On PostgreSQL the first such DB is kept as template, which the following ones get copied from,
+    as that is a lot faster than generating the schema every time.
+    """
+    config = getDBConfig(app_label="models", modules=modules)
+    template = _TEMPLATE_DBS.get(modules)
+    if template is None:
+        await Tortoise.init(config, _create_db=True)
+        await Tortoise.generate_schemas(safe=False)
+        template = Tortoise.get_connection("models")
+        if template.capabilities.dialect != "postgres":
+            return
+        # A DB can only be used as template while nobody is connected to it.
+        # Its client stays connected to the maintenance DB instead, to create and drop the copies.
+        await Tortoise.close_connections()
+        await template.create_connection(with_db=False)
+        _TEMPLATE_DBS[modules] = template
+        config = getDBConfig(app_label="models", modules=modules)
+
+    database = config["connections"]["models"]["credentials"]["database"]
+    await template.execute_script(
+        f'CREATE DATABASE "{database}" TEMPLATE "{template.database}"'  # type: ignore
+        f' OWNER "{template.user}"'  # type: ignore
+    )
+    await Tortoise.init(config)
+
+
+async def _drop_clean_db(modules: Tuple[Union[str, ModuleType], ...]) -> None:
+    template = _TEMPLATE_DBS.get(modules)
+    if template is None:
+        await Tortoise._drop_databases()
+        return
+
+    for connection in Tortoise._connections.values():
+        await connection.close()
+        await template.execute_script(f'DROP DATABASE "{connection.database}"')  # type: ignore
+    Tortoise._connections = {}
+    await Tortoise._reset_apps()
+
+
+async def _release_test_connections() -> None:
+    while _TEST_CONNECTIONS:
+        pool, connection = _TEST_CONNECTIONS.popitem()
+        await pool.release(connection)
+
+
+async def _drop_isolated() -> None:
+    while _SCHEMA_READY:
+        config, connections, conn_map = _SCHEMA_READY.popitem()[1]
+        Tortoise._connections = dict(connections)
+        current_transaction_map.update(conn_map)
+        Tortoise._inited = True
+        await Tortoise._drop_databases()
+    while _TEMPLATE_DBS:
+        template = _TEMPLATE_DBS.popitem()[1]
+        await template.close()
+        await template.db_delete()
+
+
+def _build_truncate_scripts() -> None:
+    """
+    Builds the script that clears all tables, for every connection of the default apps.
+    """
+    db_models: Dict[BaseDBAsyncClient, List[Type[Model]]] = {}
+    for app in Tortoise.apps.values():
+        for model in app.values():
+            db_models.setdefault(model._meta.db, []).append(model)
+
+    for db, models in db_models.items():
+        quote_char = db.query_class._builder().QUOTE_CHAR
+        dialect = db.capabilities.dialect
+        if dialect in ("postgres", "mysql"):
+            tables = [model._meta.db_table for model in models]
+            for model in models:
+                tables.extend(
+                    cast(ManyToManyFieldInstance, model._meta.fields_map[name]).through
+                    for name in model._meta.m2m_fields
+                )
+            quoted = [f"{quote_char}{table}{quote_char}" for table in dict.fromkeys(tables)]
+            if dialect == "postgres":
+                _TRUNCATE_SCRIPTS[db] = (
+                    f"TRUNCATE TABLE {', '.join(quoted)} RESTART IDENTITY CASCADE"  # nosec
+                )
+            else:
+                # MySQL can only truncate one table at a time, and has no CASCADE
+                truncates = "".join(f"TRUNCATE TABLE {table}; " for table in quoted)
+                _TRUNCATE_SCRIPTS[db] = (
+                    f"SET FOREIGN_KEY_CHECKS=0; {truncates}SET FOREIGN_KEY_CHECKS=1"  # nosec
+                )
+            continue
+
+        # TODO: This is a naive implementation: Will fail to clear M2M and non-cascade foreign keys
+        stmts = [f"DELETE FROM {quote_char}{model._meta.db_table}{quote_char};" for model in models]
+        if dialect == "sqlite" and any(model._meta.pk.generated for model in models):
+            # Generated pks are AUTOINCREMENT columns, tracked in sqlite_sequence
+            stmts.append("DELETE FROM sqlite_sequence;")
+        _TRUNCATE_SCRIPTS[db] = "\n".join(stmts)  # nosec
+
+
+def _substitute_worker(db_url: str) -> str:
+    worker = _os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return db_url.replace("\\{worker\\}", worker).replace("{worker}", worker)
 
 
 def initializer(
@@ -91,6 +266,8 @@ def initializer(
 
     :param modules: List of modules to look for models in.
     :param db_url: The db_url, defaults to ``sqlite://:memory``.
+        A ``{worker}`` parameter gets replaced by the pytest-xdist worker id,
+        so that every worker gets its own DB.
     :param app_label: The name of the APP to initialise the modules in, defaults to "models"
     :param loop: Optional event loop.
     """
@@ -104,15 +281,21 @@ def initializer(
     global _CONN_MAP
     _MODULES = modules
     if db_url is not None:  # pragma: nobranch
-        _TORTOISE_TEST_DB = db_url
+        db_url = _substitute_worker(db_url)
+        if db_url != _TORTOISE_TEST_DB:
+            _TORTOISE_TEST_DB = db_url
+            _getCachedDBConnections.cache_clear()
     _CONFIG = getDBConfig(app_label=app_label, modules=_MODULES)
+    _TRUNCATE_SCRIPTS.clear()
 
     loop = loop or asyncio.get_event_loop()
     _LOOP = loop
     _SELECTOR = loop._selector  # type: ignore
     loop.run_until_complete(_init_db(_CONFIG))
-    _CONNECTIONS = Tortoise._connections.copy()
-    _CONN_MAP = current_transaction_map.copy()
+    _CONNECTIONS = MappingProxyType(Tortoise._connections.copy())
+    _CONN_MAP = MappingProxyType(current_transaction_map.copy())
+    _RESOLVED_CAPS.clear()
+    _RESOLVED_CAPS.update({name: conn.capabilities for name, conn in _CONNECTIONS.items()})
     Tortoise.apps = {}
     Tortoise._connections = {}
     Tortoise._inited = False
@@ -122,10 +305,45 @@ def finalizer() -> None:
     """
     Cleans up the DB after testing. Must be called as part of the test environment teardown.
     """
-    _restore_default()
     loop = _LOOP
     loop._selector = _SELECTOR  # type: ignore
+    loop.run_until_complete(_release_test_connections())
+    loop.run_until_complete(_drop_isolated())
+    _restore_default()
     loop.run_until_complete(Tortoise._drop_databases())
+    _RESOLVED_CAPS.clear()
+
+
+def _get_shared_loop() -> AbstractEventLoop:
+    # pylint: disable=W0603
+    global _LOOP
+    if not _LOOP:
+        # Not set up through initializer(), so create the loop once and reuse it
+        _LOOP = asyncio.new_event_loop()
+    asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+
+def _cancel_pending_tasks(loop: AbstractEventLoop) -> None:
+    """
+    Cancels the tasks a test left running, like ``asyncio.Runner.close()`` does,
+    but without closing the shared loop.
+    """
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    for task in pending:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during test teardown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
 
 
 def env_initializer() -> None:  # pragma: nocoverage
@@ -163,49 +381,83 @@ class SimpleTestCase(unittest.IsolatedAsyncioTestCase):
     on the signature of the function.
     If you specify ``async test_*()`` then it will run it in an event loop.
 
+    All tests share the event loop the DB was initialised in, so that connections
+    stay usable across tests. Set ``shared_loop = False`` to run each test in a fresh
+    event loop instead (only suitable for tests that don't use the DB).
+
     Based on `asynctest <http://asynctest.readthedocs.io/>`_
     """
 
+    shared_loop: bool = True
+
     async def _setUpDB(self) -> None:
-        pass
+        if Tortoise._connections is _RESTORED_CONNECTIONS:
+            # Kept by a previous TruncationTestCase, but this test has to start without it
+            _reset_tortoise()
 
     async def _tearDownDB(self) -> None:
         pass
 
     def _setupAsyncioLoop(self):
-        loop = asyncio.get_event_loop()
-        loop.set_debug(True)
+        if not self.shared_loop:
+            return super()._setupAsyncioLoop()  # type: ignore
+        loop = _get_shared_loop()
+        if _os.environ.get("TORTOISE_TEST_DEBUG"):
+            loop.set_debug(True)
         self._asyncioTestLoop = loop
         fut = loop.create_future()
         self._asyncioCallsTask = loop.create_task(self._asyncioLoopRunner(fut))  # type: ignore
         loop.run_until_complete(fut)
 
     def _tearDownAsyncioLoop(self):
+        if not self.shared_loop:
+            return super()._tearDownAsyncioLoop()  # type: ignore
         loop = self._asyncioTestLoop
         self._asyncioTestLoop = None  # type: ignore
         self._asyncioCallsQueue.put_nowait(None)  # type: ignore
         loop.run_until_complete(self._asyncioCallsQueue.join())  # type: ignore
 
+    if sys.version_info >= (3, 11):  # pragma: nobranch
+        # Python 3.11+ runs tests through an asyncio.Runner instead
+
+        def _setupAsyncioRunner(self):
+            if not self.shared_loop:
+                return super()._setupAsyncioRunner()  # type: ignore
+            loop = _get_shared_loop()
+            # None keeps the interpreter default (PYTHONASYNCIODEBUG, -X dev)
+            debug = True if _os.environ.get("TORTOISE_TEST_DEBUG") else None
+            self._asyncioRunner = asyncio.Runner(debug=debug, loop_factory=lambda: loop)
+
+        def _tearDownAsyncioRunner(self):
+            if not self.shared_loop:
+                return super()._tearDownAsyncioRunner()  # type: ignore
+            # Don't close the runner, as that would close the shared loop as well
+            _cancel_pending_tasks(self._asyncioRunner.get_loop())
+            self._asyncioRunner = None  # type: ignore
+
     async def asyncSetUp(self) -> None:
         await self._setUpDB()
 
     async def asyncTearDown(self) -> None:
         await self._tearDownDB()
-        Tortoise.apps = {}
-        Tortoise._connections = {}
-        Tortoise._inited = False
+        # The default state is kept, so the next TruncationTestCase doesn't have to restore it
+        if Tortoise._connections is not _RESTORED_CONNECTIONS:
+            _reset_tortoise()
 
     def assertListSortEqual(
         self, list1: List[Any], list2: List[Any], msg: Any = ..., sorted_key: Optional[str] = None
     ) -> None:
-        if isinstance(list1[0], Model):
+        if not list1 or len(list1) != len(list2):
+            # No need to sort if the lists can't be equal
+            super().assertListEqual(list1, list2, msg=msg)
+        elif isinstance(list1[0], Model):
             super().assertListEqual(
-                sorted(list1, key=lambda x: x.pk), sorted(list2, key=lambda x: x.pk), msg=msg
+                sorted(list1, key=attrgetter("pk")), sorted(list2, key=attrgetter("pk")), msg=msg
             )
         elif isinstance(list1[0], dict) and sorted_key:
             super().assertListEqual(
-                sorted(list1, key=lambda x: x[sorted_key]),
-                sorted(list2, key=lambda x: x[sorted_key]),
+                sorted(list1, key=itemgetter(sorted_key)),
+                sorted(list2, key=itemgetter(sorted_key)),
                 msg=msg,
             )
         else:
@@ -214,31 +466,60 @@ class SimpleTestCase(unittest.IsolatedAsyncioTestCase):
 
 class IsolatedTestCase(SimpleTestCase):
     """
-    An asyncio capable test class that will ensure that an isolated test db
-    is available for each test.
-
-    Use this if your test needs perfect isolation.
+    An asyncio capable test class that runs its tests on a separate test db,
+    next to the one set up by ``initializer()``.
 
     Note to use ``{}`` as a string-replacement parameter, for your DB_URL.
     That will create a randomised database name.
 
-    It will create and destroy a new DB instance for every test.
+    The separate DB and its schema are created once per session (for each set of modules),
+    and every test is run in a separate transaction that will rollback on finish.
+    So sequences are not reset between tests on PostgreSQL and MySQL,
+    and transactions started by a test only nest in the test's transaction.
+
+    Set ``with_clean_db = True`` if your test needs perfect isolation: it will then create
+    and destroy a new DB instance for every test.
     This is obviously slow, but guarantees a fresh DB.
+    On PostgreSQL these DBs are copied from a template DB, which is built once per session.
 
     If you define a ``tortoise_test_modules`` list, it overrides the DB setup module for the tests.
     """
 
     tortoise_test_modules: Iterable[Union[str, ModuleType]] = []
+    with_clean_db: bool = False
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.__db__: BaseDBAsyncClient = None  # type: ignore
+        self.__transaction__: Optional[TransactionTestContext] = None
+        self._connections: dict = {}
+        self._modules: Tuple[Union[str, ModuleType], ...] = ()
 
     async def _setUpDB(self) -> None:
-        config = getDBConfig(app_label="models", modules=self.tortoise_test_modules or _MODULES)
-        await Tortoise.init(config, _create_db=True)
-        await Tortoise.generate_schemas(safe=False)
-        self._connections = Tortoise._connections.copy()
+        await super(IsolatedTestCase, self)._setUpDB()
+        modules = tuple(self.tortoise_test_modules or _MODULES)
+        self.__transaction__ = None
+        if not self.with_clean_db:
+            await _restore_isolated(modules)
+            self.__db__ = Tortoise.get_connection("models")
+            if self.__db__.capabilities.supports_transactions:
+                self.__transaction__ = TransactionTestContext(
+                    self.__db__._in_transaction().connection
+                )
+                await self.__transaction__.__aenter__()  # type: ignore
+                return
+
+        await _init_clean_db(modules)
+        self._connections = Tortoise._connections
+        self._modules = modules
 
     async def _tearDownDB(self) -> None:
-        Tortoise._connections = self._connections.copy()
-        await Tortoise._drop_databases()
+        if self.__transaction__ is not None:
+            await self.__transaction__.__aexit__(None, None, None)
+            return
+
+        Tortoise._connections = self._connections
+        await _drop_clean_db(self._modules)
 
 
 class TruncationTestCase(SimpleTestCase):
@@ -248,25 +529,31 @@ class TruncationTestCase(SimpleTestCase):
     Use this when your tests contain transactions.
 
     This is slower than ``TestCase`` but faster than ``IsolatedTestCase``.
-    Note that usage of this does not guarantee that auto-number-pks will be reset to 1.
+    Auto-number-pks will be reset to 1 on SQLite, PostgreSQL and MySQL.
     """
 
     async def _setUpDB(self) -> None:
-        await super(TruncationTestCase, self)._setUpDB()
+        # Not calling super(), as that would drop the default state restored for the previous test
         _restore_default()
 
     async def _tearDownDB(self) -> None:
         _restore_default()
-        # TODO: This is a naive implementation: Will fail to clear M2M and non-cascade foreign keys
-        for app in Tortoise.apps.values():
-            for model in app.values():
-                quote_char = model._meta.db.query_class._builder().QUOTE_CHAR
-                await model._meta.db.execute_script(  # nosec
-                    f"DELETE FROM {quote_char}{model._meta.db_table}{quote_char}"
-                )
+        if not _TRUNCATE_SCRIPTS:
+            _build_truncate_scripts()
+        for db, script in _TRUNCATE_SCRIPTS.items():
+            await db.execute_script(script)
         await super(TruncationTestCase, self)._tearDownDB()
 
 
+def _is_closed(connection: Any) -> bool:
+    # asyncpg has is_closed(), asyncmy a connected flag, aiomysql and psycopg a closed flag
+    if hasattr(connection, "is_closed"):
+        return connection.is_closed()
+    if hasattr(connection, "connected"):
+        return not connection.connected
+    return bool(getattr(connection, "closed", False))
+
+
 class TransactionTestContext:
     __slots__ = ("connection", "connection_name", "token")
 
@@ -278,15 +565,47 @@ class TransactionTestContext:
         current_transaction = current_transaction_map[self.connection_name]
         self.token = current_transaction.set(self.connection)
         if hasattr(self.connection, "_parent"):
-            self.connection._connection = await self.connection._parent._pool.acquire()
-        await self.connection.start()
+            pool = self.connection._parent._pool
+            connection = _TEST_CONNECTIONS.pop(pool, None)
+            if connection is not None and _is_closed(connection):
+                # Let the pool replace a connection that got closed since the last test
+                await pool.release(connection)
+                connection = None
+            self.connection._connection = connection or await pool.acquire()
+            try:
+                await self.connection.start()
+            except BaseException:
+                await pool.release(self.connection._connection)
+                current_transaction.reset(self.token)
+                raise
+        else:
+            await self.connection.start()
         return self.connection
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        await self.connection.rollback()
-        if hasattr(self.connection, "_parent"):
-            await self.connection._parent._pool.release(self.connection._connection)
-        current_transaction_map[self.connection_name].reset(self.token)
+        keep = exc_type is None
+        try:
+            await self.connection.rollback()
+        except BaseException:
+            keep = False
+            raise
+        finally:
+            current_transaction_map[self.connection_name].reset(self.token)
+            if hasattr(self.connection, "_parent"):
+                await self._put_back(keep)
+
+    async def _put_back(self, keep: bool) -> None:
+        """
+        Keeps the pool connection for the next test, as releasing and re-acquiring it for every test
+        is slow. It goes back to the pool instead if it might be broken, or if the pool has no other
+        connection for queries outside of the test transaction.
+        """
+        parent = self.connection._parent
+        connection = self.connection._connection
+        if keep and parent.pool_maxsize > 1 and not _is_closed(connection):
+            _TEST_CONNECTIONS[parent._pool] = connection
+        else:
+            await parent._pool.release(connection)
 
 
 class TestCase(TruncationTestCase):
@@ -297,9 +616,13 @@ class TestCase(TruncationTestCase):
     This is a fast test runner. Don't use it if your test uses transactions.
     """
 
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.__db__: BaseDBAsyncClient = None  # type: ignore
+        self.__transaction__: TransactionTestContext = None  # type: ignore
+
     async def asyncSetUp(self) -> None:
         await super(TestCase, self).asyncSetUp()
-        _restore_default()
         self.__db__ = Tortoise.get_connection("models")
         self.__transaction__ = TransactionTestContext(self.__db__._in_transaction().connection)
         await self.__transaction__.__aenter__()  # type: ignore
@@ -312,18 +635,75 @@ class TestCase(TruncationTestCase):
         await super(TestCase, self)._setUpDB()
 
     async def _tearDownDB(self) -> None:
-        if self.__db__.capabilities.supports_transactions:
-            _restore_default()
-        else:
+        # The transaction got rolled back already, so there is nothing to clear
+        if not self.__db__.capabilities.supports_transactions:
             await super()._tearDownDB()
 
 
+# Capabilities that a client only knows once connected, e.g. MySQL on MyISAM has no transactions
+_LIVE_CAPABILITIES = frozenset({"supports_transactions"})
+
+
+def _static_capabilities(connection_name: str) -> Optional[Capabilities]:
+    """
+    Returns the class-level capabilities of the client that ``TORTOISE_TEST_DB`` selects,
+    as those are known before ``initializer()`` has run.
+    """
+    db_url = _os.environ.get("TORTOISE_TEST_DB")
+    if not db_url or connection_name != _os.environ.get("TORTOISE_TEST_APP", "models"):
+        return None
+    try:
+        engine = _expand_db_url(_substitute_worker(db_url), testing=True)["engine"]
+        return Tortoise._discover_client_class(engine).capabilities
+    except (ConfigurationError, ImportError):
+        return None
+
+
+def _decide_capability(connection_name: str, conditions: dict) -> Tuple[bool, Optional[str]]:
+    """
+    Checks the conditions against the capabilities known before the test runs.
+
+    Returns whether that settles it, and if so the reason to skip the test for.
+    """
+    if connection_name in _RESOLVED_CAPS:
+        capabilities: Optional[Capabilities] = _RESOLVED_CAPS[connection_name]
+        known = conditions
+    elif Tortoise._inited and connection_name in Tortoise._connections:
+        capabilities = Tortoise.get_connection(connection_name).capabilities
+        known = conditions
+    else:
+        capabilities = _static_capabilities(connection_name)
+        known = {key: val for key, val in conditions.items() if key not in _LIVE_CAPABILITIES}
+    if capabilities is None:
+        return False, None
+    try:
+        reason = _mismatched_capability(capabilities, known)
+    except ConfigurationError:
+        # Leave it to the test run, so this fails the affected tests instead of the import
+        return False, None
+    return bool(reason) or len(known) == len(conditions), reason
+
+
+def _mismatched_capability(capabilities: Capabilities, conditions: dict) -> Optional[str]:
+    for key, val in conditions.items():
+        if not hasattr(capabilities, key):
+            raise ConfigurationError(f"Unknown capability {key}")
+        if getattr(capabilities, key) != val:
+            return f"Capability {key} != {val}"
+    return None
+
+
 def requireCapability(connection_name: str = "models", **conditions: Any):
     """
     Skip a test if the required capabilities are not matched.
 
     .. note::
         The database must be initialized *before* the decorated test runs.
+        If the capabilities are known already when a test gets decorated,
+        the decision is made right away and the test is marked as skipped up front.
+        Before ``initializer()`` has run, e.g. while pytest collects the tests,
+        they are taken from the DB client that the ``TORTOISE_TEST_DB`` environment variable
+        selects, except for ``supports_transactions``, which is only known once connected.
 
     Usage:
 
@@ -346,24 +726,46 @@ def requireCapability(connection_name: str = "models", **conditions: Any):
     """
 
     def decorator(test_item):
+        decided, reason = _decide_capability(connection_name, conditions)
+        if decided:
+            # No need to check on every test run
+            return skip(reason)(test_item) if reason else test_item
+
         if not isinstance(test_item, type):
+            # The connection checked last, and the resulting skip reason
+            checked: Optional[Tuple[BaseDBAsyncClient, Optional[str]]] = None
+
+            def check() -> None:
+                nonlocal checked
+                db = Tortoise.get_connection(connection_name)
+                if checked is None or checked[0] is not db:
+                    checked = (db, _mismatched_capability(db.capabilities, conditions))
+                if checked[1]:
+                    raise SkipTest(checked[1])
+
+            if asyncio.iscoroutinefunction(test_item):
+                # Stay a coroutine function, so the test case still awaits the test
+
+                @wraps(test_item)
+                async def async_skip_wrapper(*args, **kwargs):
+                    check()
+                    return await test_item(*args, **kwargs)
+
+                return async_skip_wrapper
 
             @wraps(test_item)
             def skip_wrapper(*args, **kwargs):
-                db = Tortoise.get_connection(connection_name)
-                for key, val in conditions.items():
-                    if getattr(db.capabilities, key) != val:
-                        raise SkipTest(f"Capability {key} != {val}")
+                check()
                 return test_item(*args, **kwargs)
 
             return skip_wrapper
 
         # Assume a class is decorated
-        funcs = {
-            var: getattr(test_item, var)
-            for var in dir(test_item)
-            if var.startswith("test_") and callable(getattr(test_item, var))
-        }
+        funcs: Dict[str, Any] = {}
+        for klass in test_item.__mro__:
+            for name, func in vars(klass).items():
+                if name.startswith("test_") and callable(func):
+                    funcs.setdefault(name, func)
         for name, func in funcs.items():
             setattr(
                 test_item,